@@ -1,19 +1,191 @@
 import streamlit as st
 import json
+import os
+import threading
 import time
+import uuid
+from collections import Counter, defaultdict
 from pathlib import Path
 
+import services
+
+try:
+    import fcntl
+except ImportError:  # Windows - no advisory locks
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library json module
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Not on Linux, or inotify_simple isn't installed
+    INotify = None
+
+# Set BOOKBASE_IPC=files to talk to the standalone microservices through
+# their request/response text files instead of calling them in-process.
+USE_FILE_IPC = os.environ.get("BOOKBASE_IPC") == "files"
+# Set BOOKBASE_REMOTE_COUNTER=1 to send statistics through the Data Counter
+# service instead of counting them locally.
+USE_REMOTE_COUNTER = os.environ.get("BOOKBASE_REMOTE_COUNTER") == "1"
+FALLBACK_POLL_INTERVAL = 0.005  # seconds, used when inotify is unavailable
+
 
 # ============================================================
 # MICROSERVICE CLIENTS
 # ============================================================
 
+def _read_response(path: Path) -> bytes:
+    """Return the raw contents of a response file, or b"" if there are none yet."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return b""
+    return b"" if data.isspace() else data
+
+
+class _ResponseWatcher:
+    """
+    One inotify watch on a directory, shared by every session waiting for a response there.
+    Only one waiter reads events at a time; the others sleep on a condition and are
+    woken after each read, so every waiter rechecks its own file.
+    """
+
+    def __init__(self, directory: str):
+        self.inotify = INotify()
+        self.inotify.add_watch(directory, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+        self.changed = threading.Condition()
+        self.generation = 0  # Bumped after every read, so a waiter can tell it missed one
+        self.reading = False
+
+    def wait(self, generation: int, timeout: float):
+        """Wait up to timeout seconds for a write after the given generation."""
+        with self.changed:
+            if self.generation != generation:
+                return  # Something was written since the caller last checked
+            if self.reading:
+                self.changed.wait(timeout)
+                return
+            self.reading = True
+        try:
+            # Block on inotify without holding the lock, so other waiters aren't queued behind us
+            self.inotify.read(timeout=int(timeout * 1000) + 1)
+        finally:
+            with self.changed:
+                self.reading = False
+                self.generation += 1
+                self.changed.notify_all()
+
+
+@st.cache_resource
+def _get_response_watcher(directory: str) -> _ResponseWatcher:
+    """
+    Return the persistent watcher for finished writes in directory.
+    Cached so every file-based service call reuses one inotify descriptor instead
+    of setting up a new watch.
+    """
+    return _ResponseWatcher(directory)
+
+
+def _wait_for_response(path: Path, timeout: float, parse=None):
+    """
+    Block until a microservice writes its response file and return the raw bytes.
+    If parse is given, the content is passed through it and waiting continues
+    while it returns None (e.g. a stale response from an earlier request).
+    Uses inotify on Linux so we wake as soon as the writer closes the file,
+    and falls back to a short poll elsewhere. Returns None on timeout.
+    """
+    deadline = time.monotonic() + timeout
+
+    def check():
+        content = _read_response(path)
+        if not content:
+            return None
+        return parse(content) if parse else content
+
+    if INotify is not None:
+        # Watch the directory so both in-place writes and renames are seen
+        watcher = _get_response_watcher(str(path.parent.resolve()))
+        while True:
+            # Note the generation before checking, so a write landing in between isn't missed
+            generation = watcher.generation
+            result = check()
+            if result is not None:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            watcher.wait(generation, remaining)
+
+    while True:
+        result = check()
+        if result is not None:
+            return result
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(FALLBACK_POLL_INTERVAL)
+
+
+def _append_request(request_file: Path, line: str):
+    """Queue one request line, locked so the service can't clear the file mid-append."""
+    with open(request_file, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        f.write(line)
+
+
+def _call_json_service(request_file: Path, response_file: Path, request_data: dict, timeout: float,
+                       append: bool = False) -> dict:
+    """
+    Send a request tagged with a fresh id and wait for the response echoing that id.
+    The id lets us skip whatever response is already in the file, so it doesn't
+    have to be cleared first. With append=True the request is queued as one line
+    of a batch (for services that accept one request per line) instead of
+    overwriting the request file.
+    """
+    request_id = uuid.uuid4().hex
+    request_line = json.dumps({**request_data, "id": request_id})
+    if append:
+        _append_request(request_file, request_line + "\n")
+    else:
+        request_file.write_text(request_line)
+
+    def parse(content):
+        if request_id.encode() not in content:
+            return None  # Cheap check before parsing a file of other clients' responses
+        try:
+            responses = [_json_loads(content)]
+        except (json.JSONDecodeError, ValueError):
+            # Batched responses come back one per line
+            responses = []
+            for line in content.splitlines():
+                try:
+                    responses.append(_json_loads(line))
+                except (json.JSONDecodeError, ValueError):
+                    continue  # Partially written, or someone else's - not ours
+        for response in responses:
+            if isinstance(response, dict) and response.get("id") == request_id:
+                return response
+        return None
+
+    response = _wait_for_response(response_file, timeout, parse)
+    if response is None:
+        return {"success": False, "error": "Microservice timeout"}
+    return response
+
+
 def call_rng_service(request_data: dict, timeout: float = 5.0) -> dict:
     """
-    Call the RNG microservice via text files.
+    Call the RNG microservice.
+    Runs in-process unless BOOKBASE_IPC=files, which uses:
     Request file: rng_request.txt
     Response file: rng_response.txt
     """
+    if not USE_FILE_IPC:
+        return services.rng_select(request_data.get("items", []))
+
     request_file = Path("rng_request.txt")
     response_file = Path("rng_response.txt")
 
@@ -24,77 +196,82 @@ def call_rng_service(request_data: dict, timeout: float = 5.0) -> dict:
     request_file.write_text(json.dumps(request_data))
 
     # Wait for response
-    start = time.time()
-    while time.time() - start < timeout:
-        time.sleep(0.1)
-        content = response_file.read_text().strip()
-        if content:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {"status": "error", "message": "Invalid JSON response"}
-
-    return {"status": "error", "message": "Microservice timeout"}
+    content = _wait_for_response(response_file, timeout)
+    if content is None:
+        return {"status": "error", "message": "Microservice timeout"}
+    try:
+        return _json_loads(content)
+    except (json.JSONDecodeError, ValueError):
+        return {"status": "error", "message": "Invalid JSON response"}
 
 
 def call_text_formatter(text: str, format_type: str, timeout: float = 5.0) -> dict:
     """
     Call the Text Formatter microservice.
+    Runs in-process unless BOOKBASE_IPC=files, which uses:
     Request file: text_formatter_request.txt
     Response file: text_formatter_response.txt
     Formats: upper, lower, title, clean
     """
-    request_file = Path("text_formatter_request.txt")
-    response_file = Path("text_formatter_response.txt")
-
-    response_file.write_text("")
-    request_file.write_text(json.dumps({"text": text, "format": format_type}))
-
-    start = time.time()
-    while time.time() - start < timeout:
-        time.sleep(0.1)
-        content = response_file.read_text().strip()
-        if content:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {"success": False, "error": "Invalid JSON response"}
-
-    return {"success": False, "error": "Microservice timeout"}
+    if not USE_FILE_IPC:
+        return services.format_text(text, format_type)
+
+    return _call_json_service(
+        Path("text_formatter_request.txt"),
+        Path("text_formatter_response.txt"),
+        {"text": text, "format": format_type},
+        timeout,
+        append=True
+    )
 
 
 def call_data_counter(items: list, timeout: float = 5.0) -> dict:
     """
     Call the Data Counter microservice.
+    Runs in-process unless BOOKBASE_IPC=files, which uses:
     Request file: data_counter_request.txt
     Response file: data_counter_response.txt
     """
-    request_file = Path("data_counter_request.txt")
-    response_file = Path("data_counter_response.txt")
-
-    response_file.write_text("")
-    request_file.write_text(json.dumps({"mode": "count", "data": items}))
+    if not USE_FILE_IPC:
+        return services.count_items(items)
+
+    return _call_json_service(
+        Path("data_counter_request.txt"),
+        Path("data_counter_response.txt"),
+        {"mode": "count", "data": items},
+        timeout
+    )
 
-    start = time.time()
-    while time.time() - start < timeout:
-        time.sleep(0.1)
-        content = response_file.read_text().strip()
-        if content:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return {"success": False, "error": "Invalid JSON response"}
 
-    return {"success": False, "error": "Microservice timeout"}
+def call_data_counter_multi(datasets: dict, timeout: float = 5.0) -> dict:
+    """
+    Count several named lists with one Data Counter request ("multi" mode).
+    Runs in-process unless BOOKBASE_IPC=files, which uses:
+    Request file: data_counter_request.txt
+    Response file: data_counter_response.txt
+    """
+    if not USE_FILE_IPC:
+        return services.count_many(datasets)
+
+    return _call_json_service(
+        Path("data_counter_request.txt"),
+        Path("data_counter_response.txt"),
+        {"mode": "multi", "datasets": datasets},
+        timeout
+    )
 
 
 def call_words_service(text: str, timeout: float = 5.0) -> str:
     """
     Call Silas's Words microservice.
+    Runs in-process unless BOOKBASE_IPC=files, which uses:
     Input file: input.txt
     Output file: output.csv
     Returns: CSV string of most common words
     """
+    if not USE_FILE_IPC:
+        return services.common_words(text)
+
     input_file = Path("input.txt")
     output_file = Path("output.csv")
 
@@ -106,61 +283,122 @@ def call_words_service(text: str, timeout: float = 5.0) -> str:
     input_file.write_text(text)
 
     # Wait for response
-    start = time.time()
-    while time.time() - start < timeout:
-        time.sleep(0.1)
-        if output_file.exists():
-            content = output_file.read_text().strip()
-            if content:
-                return content
-
-    return ""
+    content = _wait_for_response(output_file, timeout)
+    return content.decode().strip() if content else ""
 
 
 # ============================================================
 # Data Persistence
 # ============================================================
 
+def _json_dumps(obj, pretty=False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(content):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _atomic_save(path, obj, pretty=False):
+    """Write obj to path as JSON in one buffered write, replacing the file atomically."""
+    data = _json_dumps(obj, pretty)
+    # A unique temp name, so two sessions saving at once don't share one temp file
+    # ('x' mode rather than mkstemp keeps the usual umask permissions)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'xb', buffering=65536) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _parse_json_list(path):
+    """Parse a JSON list file. Returns empty list if the file is empty or invalid."""
+    try:
+        data = Path(path).read_bytes()
+        if not data or data.isspace():
+            return []
+        return _json_loads(data)
+    except (json.JSONDecodeError, ValueError):
+        return []
+
+
+def _normalize_series(books):
+    """Strip series names in place, storing blank ones as None. Returns books."""
+    for book in books:
+        series_name = book.get('series_name')
+        if isinstance(series_name, str):
+            book['series_name'] = series_name.strip() or None
+    return books
+
+
+@st.cache_data
+def _load_books_cached(mtime_ns):
+    """Parse books.json, cached per modification time so unchanged files aren't re-read."""
+    return _normalize_series(_parse_json_list('books.json'))
+
+
+@st.cache_data
+def _load_read_books_cached(mtime_ns):
+    """Parse read_books.json, cached per modification time so unchanged files aren't re-read."""
+    return _normalize_series(_parse_json_list('read_books.json'))
+
+
 def load_books():
     """Load books from JSON file. Returns empty list if file doesn't exist or is invalid."""
     books_file = Path('books.json')
     if books_file.exists():
-        try:
-            with open(books_file, 'r') as f:
-                content = f.read().strip()
-                if not content:
-                    return []
-                return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
-            return []
+        return _load_books_cached(books_file.stat().st_mtime_ns)
     return []
 
 
-def save_books(books):
-    """Save books to JSON file."""
-    with open('books.json', 'w') as f:
-        json.dump(books, f, indent=2)
+def save_books(books, pretty=False):
+    """Save books to JSON file. Pass pretty=True for indented, human-readable output."""
+    _atomic_save('books.json', books, pretty)
+    _load_books_cached.clear()
 
 
 def load_read_books():
     """Load reading history from JSON file."""
     read_file = Path('read_books.json')
     if read_file.exists():
-        try:
-            with open(read_file, 'r') as f:
-                content = f.read().strip()
-                if not content:
-                    return []
-                return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
-            return []
+        return _load_read_books_cached(read_file.stat().st_mtime_ns)
     return []
 
 
-def save_read_books(read_books):
-    """Save reading history to JSON file."""
-    with open('read_books.json', 'w') as f:
-        json.dump(read_books, f, indent=2)
+def save_read_books(read_books, pretty=False):
+    """Save reading history to JSON file. Pass pretty=True for indented, human-readable output."""
+    _atomic_save('read_books.json', read_books, pretty)
+    _load_read_books_cached.clear()
+
+
+def load_state():
+    """Load the TBR list and reading history together. Returns (books, read_books)."""
+    return load_books(), load_read_books()
+
+
+def _save_changes(*names):
+    """Save the session lists that changed ("books", "read_books") and invalidate memoized results."""
+    if "books" in names:
+        save_books(st.session_state.books)
+    if "read_books" in names:
+        save_read_books(st.session_state.read_books)
+    st.session_state.version += 1
 
 
 # ============================================================
@@ -169,6 +407,16 @@ def save_read_books(read_books):
 
 def get_available_books(books, read_books):
     """Filter books to only include those ready to read, respecting series order."""
+    # Highest series number read so far, per series
+    max_read = {}
+    for b in read_books:
+        series_name = b.get('series_name')
+        if not series_name:
+            continue
+        series_number = b.get('series_number') or 0
+        if series_number >= max_read.get(series_name, 0):
+            max_read[series_name] = series_number
+
     available = []
 
     for book in books:
@@ -179,14 +427,8 @@ def get_available_books(books, read_books):
         series_name = book['series_name']
         series_number = book['series_number']
 
-        read_in_series = [
-            b for b in read_books
-            if b.get('series_name') == series_name
-        ]
-
-        if read_in_series:
-            max_read = max(b.get('series_number', 0) for b in read_in_series)
-            if series_number <= max_read + 1:
+        if series_name in max_read:
+            if series_number <= max_read[series_name] + 1:
                 available.append(book)
         else:
             if series_number == 1:
@@ -195,6 +437,43 @@ def get_available_books(books, read_books):
     return available
 
 
+def _memoize_for_version(name, fn, *args):
+    """Return fn(*args), recomputed only when this session's book lists have changed."""
+    memo_key = f"memo_{name}"
+    cached = st.session_state.get(memo_key)
+    if cached is None or cached[0] != st.session_state.version:
+        cached = (st.session_state.version, fn(*args))
+        st.session_state[memo_key] = cached
+    return cached[1]
+
+
+def local_count(items):
+    """Count items locally, returning the same shape as the Data Counter "count" mode."""
+    counts = Counter(map(str, items))
+    return {
+        "success": True,
+        "total_count": len(items),
+        "unique_count": len(counts),
+        "item_counts": dict(counts),
+        "error": ""
+    }
+
+
+def get_statistics(books):
+    """Collect genres and authors and count each. Returns (genres, authors, results)."""
+    genres = [book.get('genre') for book in books if book.get('genre')]
+    authors = [book.get('author') for book in books if book.get('author')]
+
+    if USE_REMOTE_COUNTER:
+        # Use Data Counter microservice - one request covers both breakdowns
+        multi_response = call_data_counter_multi({"genres": genres, "authors": authors})
+        results = multi_response.get("results", {}) if multi_response.get("success") else {}
+    else:
+        results = {"genres": local_count(genres), "authors": local_count(authors)}
+
+    return genres, authors, results
+
+
 def show_book_edit_form(book, book_key):
     """Display the edit form for a book and handle save/cancel."""
     st.markdown("---")
@@ -218,19 +497,16 @@ def show_book_edit_form(book, book_key):
             cancel_edit = st.form_submit_button("Cancel", use_container_width=True)
 
         if save_edit:
-            # Use Text Formatter microservice for title case
-            formatted = call_text_formatter(edit_title, "title")
-            if formatted.get("success"):
-                book['title'] = formatted["result"]
-            else:
-                book['title'] = edit_title
+            # Same result as the Text Formatter's "title" format, without the round trip
+            book['title'] = edit_title.title()
 
             book['author'] = edit_author
             book['genre'] = edit_genre if edit_genre else None
+            edit_series = (edit_series or "").strip()
             book['series_name'] = edit_series if edit_series else None
             book['series_number'] = int(edit_number) if edit_series else None
 
-            save_books(st.session_state.books)
+            _save_changes("books")
             st.session_state[f'editing_{book_key}'] = False
             st.success("Book updated!")
             st.rerun()
@@ -251,10 +527,11 @@ def main():
         layout="wide"
     )
 
-    if 'books' not in st.session_state:
-        st.session_state.books = load_books()
-    if 'read_books' not in st.session_state:
-        st.session_state.read_books = load_read_books()
+    if 'books' not in st.session_state or 'read_books' not in st.session_state:
+        st.session_state.books, st.session_state.read_books = load_state()
+    if 'version' not in st.session_state:
+        # Bumped on every change to the book lists; keys memoized results
+        st.session_state.version = 0
 
     st.title("BookBase")
 
@@ -343,13 +620,9 @@ def main():
             )
 
             if submitted:
+                series_name = series_name.strip()
                 if title and author:
-                    # Use Text Formatter microservice for title case
-                    formatted = call_text_formatter(title, "title")
-                    if formatted.get("success"):
-                        final_title = formatted["result"]
-                    else:
-                        final_title = title  # Fallback if microservice unavailable
+                    final_title = title.title()
 
                     new_book = {
                         'title': final_title,
@@ -360,7 +633,7 @@ def main():
                     }
 
                     st.session_state.books.append(new_book)
-                    save_books(st.session_state.books)
+                    _save_changes("books")
 
                     st.session_state.book_added_message = f"'{final_title}' has been added to your TBR list!"
                     st.session_state.show_add_confirmation = True
@@ -378,28 +651,27 @@ def main():
             book_count = len(st.session_state.books)
             st.success(f"You have {book_count} {'book' if book_count == 1 else 'books'} in your TBR list")
 
-            series_books = {}
+            series_books = defaultdict(list)
             standalone_books = []
 
-            for book in st.session_state.books:
+            # Keep each book's list index so buttons can pop it directly
+            for i, book in enumerate(st.session_state.books):
                 series_name = book.get('series_name')
-                if series_name and series_name.strip():
-                    series_key = series_name.strip()
-                    if series_key not in series_books:
-                        series_books[series_key] = []
-                    series_books[series_key].append(book)
+                if series_name:
+                    series_books[series_name].append((i, book))
                 else:
-                    standalone_books.append(book)
+                    standalone_books.append((i, book))
 
             if series_books:
                 st.subheader("Series Books")
                 for series_name, books in sorted(series_books.items()):
-                    books.sort(key=lambda x: x.get('series_number', 0))
+                    books.sort(key=lambda x: x[1].get('series_number', 0))
 
                     with st.expander(f"**{series_name}** ({len(books)} {'book' if len(books) == 1 else 'books'})",
                                      expanded=True):
-                        for book in books:
-                            book_key = f"{book['title']}_{book.get('series_number', 0)}"
+                        for i, book in books:
+                            # The list index keeps keys unique when titles repeat
+                            book_key = f"{book['title']}_{book.get('series_number', 0)}_{i}"
 
                             if st.session_state.get(f'editing_{book_key}', False):
                                 show_book_edit_form(book, book_key)
@@ -416,22 +688,21 @@ def main():
                                         st.rerun()
                                 with col3:
                                     if st.button("Mark Read", key=f"read_{book_key}", help="Mark as read"):
-                                        st.session_state.books.remove(book)
+                                        st.session_state.books.pop(i)
                                         st.session_state.read_books.append(book)
-                                        save_books(st.session_state.books)
-                                        save_read_books(st.session_state.read_books)
+                                        _save_changes("books", "read_books")
                                         st.success(f"Marked '{book['title']}' as read!")
                                         st.rerun()
                                 with col4:
                                     if st.button("Remove", key=f"remove_{book_key}", help="Remove from list"):
-                                        st.session_state.books.remove(book)
-                                        save_books(st.session_state.books)
+                                        st.session_state.books.pop(i)
+                                        _save_changes("books")
                                         st.rerun()
 
             if standalone_books:
                 st.subheader("Standalone Books")
-                for book in standalone_books:
-                    book_key = f"{book['title']}_standalone"
+                for i, book in standalone_books:
+                    book_key = f"{book['title']}_standalone_{i}"
 
                     if st.session_state.get(f'editing_{book_key}', False):
                         show_book_edit_form(book, book_key)
@@ -448,16 +719,15 @@ def main():
                                 st.rerun()
                         with col3:
                             if st.button("Mark Read", key=f"read_{book_key}", help="Mark as read"):
-                                st.session_state.books.remove(book)
+                                st.session_state.books.pop(i)
                                 st.session_state.read_books.append(book)
-                                save_books(st.session_state.books)
-                                save_read_books(st.session_state.read_books)
+                                _save_changes("books", "read_books")
                                 st.success(f"Marked '{book['title']}' as read!")
                                 st.rerun()
                         with col4:
                             if st.button("Remove", key=f"remove_{book_key}", help="Remove from list"):
-                                st.session_state.books.remove(book)
-                                save_books(st.session_state.books)
+                                st.session_state.books.pop(i)
+                                _save_changes("books")
                                 st.rerun()
 
     # TAB 3: Get Suggestion (Uses RNG Microservice)
@@ -471,7 +741,9 @@ def main():
         if not st.session_state.books:
             st.warning("Add some books to your TBR list first!")
         else:
-            available_books = get_available_books(
+            available_books = _memoize_for_version(
+                "available_books",
+                get_available_books,
                 st.session_state.books,
                 st.session_state.read_books
             )
@@ -524,7 +796,7 @@ def main():
             read_count = len(st.session_state.read_books)
             st.success(f"You've read {read_count} {'book' if read_count == 1 else 'books'}!")
 
-            for book in st.session_state.read_books:
+            for i, book in enumerate(st.session_state.read_books):
                 with st.expander(f"**{book['title']}** by {book['author']}"):
                     col1, col2 = st.columns([4, 1])
                     with col1:
@@ -537,15 +809,14 @@ def main():
                             )
                     with col2:
                         if st.button("Unread",
-                                     key=f"unread_{book['title']}_{book.get('series_number', 'standalone')}"):
-                            st.session_state.read_books.remove(book)
+                                     key=f"unread_{book['title']}_{book.get('series_number', 'standalone')}_{i}"):
+                            st.session_state.read_books.pop(i)
                             st.session_state.books.append(book)
-                            save_books(st.session_state.books)
-                            save_read_books(st.session_state.read_books)
+                            _save_changes("books", "read_books")
                             st.success(f"Moved '{book['title']}' back to TBR list!")
                             st.rerun()
 
-    # TAB 5: Statistics (Uses Data Counter and Words Microservices)
+    # TAB 5: Statistics (Uses Data Counter Microservice if enabled)
     with tab5:
         st.header("Reading Statistics")
 
@@ -554,15 +825,19 @@ def main():
         if not all_books:
             st.info("Add some books to see statistics!")
         else:
+            # Only recounted when the book lists change, not on every rerun
+            genres, authors, results = _memoize_for_version("statistics", get_statistics, all_books)
+            if not results:
+                # Data Counter call failed - don't keep the failure, retry next rerun
+                st.session_state.pop("memo_statistics", None)
+
             col1, col2 = st.columns(2)
 
             with col1:
                 st.subheader("Genre Breakdown")
-                # Use Data Counter microservice
-                genres = [book.get('genre') for book in all_books if book.get('genre')]
 
                 if genres:
-                    counter_response = call_data_counter(genres)
+                    counter_response = results.get("genres", {})
                     if counter_response.get("success"):
                         st.metric("Total Books with Genres", counter_response["total_count"])
                         st.metric("Unique Genres", counter_response["unique_count"])
@@ -580,10 +855,9 @@ def main():
 
             with col2:
                 st.subheader("Author Breakdown")
-                authors = [book.get('author') for book in all_books if book.get('author')]
 
                 if authors:
-                    counter_response = call_data_counter(authors)
+                    counter_response = results.get("authors", {})
                     if counter_response.get("success"):
                         st.metric("Unique Authors", counter_response["unique_count"])
 
@@ -603,16 +877,16 @@ def main():
 
             if st.button("Analyze Titles"):
                 # Combine all titles into one string
-                all_titles = " ".join([book.get('title', '') for book in all_books])
+                all_titles = " ".join(book.get('title', '') for book in all_books)
 
                 if all_titles.strip():
-                    result = call_words_service(all_titles)
+                    # Computed locally - too small a job to round-trip to the Words service
+                    result = services.common_words(all_titles)
                     if result:
                         st.success("Most common words in your book titles:")
                         st.code(result)
                     else:
-                        st.warning("Words service unavailable or timed out")
-                        st.caption("Make sure Silas's words microservice is running!")
+                        st.info("No common words found in your titles")
                 else:
                     st.info("No titles to analyze")
 
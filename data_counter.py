@@ -3,6 +3,7 @@ Data Counter Microservice
 Author: Elizabeth Peyton
 
 Counts items in a list (total and unique) or provides character/word statistics.
+Several lists can be counted in one round-trip with "multi" mode.
 
 Communication: Text files
 - Request file: data_counter_request.txt
@@ -13,6 +14,11 @@ Request format (JSON):
     "mode": "count" | "stats",
     "data": ["item1", "item2", ...] for count mode, or "text string" for stats mode
 }
+or, for "multi" mode:
+{
+    "mode": "multi",
+    "datasets": {"name": ["item1", ...], ...}
+}
 
 Response format (JSON):
 
@@ -32,9 +38,17 @@ For "stats" mode:
     "word_count": number,
     "error": ""
 }
+
+For "multi" mode:
+{
+    "success": true/false,
+    "results": {"name": <"count" mode response>, ...},
+    "error": ""
+}
 """
 
 import json
+import re
 import time
 from pathlib import Path
 from collections import Counter
@@ -43,6 +57,9 @@ REQUEST_FILE = "data_counter_request.txt"
 RESPONSE_FILE = "data_counter_response.txt"
 POLL_INTERVAL = 0.1  # seconds
 
+# An "id" field, found by pattern in a request that isn't valid JSON
+_ID_RE = re.compile(r'"id"\s*:\s*("(?:[^"\\]|\\.)*")')
+
 
 def count_items(items: list) -> dict:
     """Count total items, unique items, and frequency of each item."""
@@ -93,7 +110,7 @@ def process_request(request_data: dict) -> dict:
         if not mode:
             return {
                 "success": False,
-                "error": "Missing 'mode' field. Use 'count' or 'stats'."
+                "error": "Missing 'mode' field. Use 'count', 'stats', or 'multi'."
             }
         
         if mode == "count":
@@ -113,11 +130,24 @@ def process_request(request_data: dict) -> dict:
             if data is None:
                 data = ""
             return get_text_stats(data)
+
+        elif mode == "multi":
+            datasets = request_data.get("datasets")
+            if not isinstance(datasets, dict):
+                return {
+                    "success": False,
+                    "error": "'datasets' must be an object mapping names to lists for 'multi' mode."
+                }
+            return {
+                "success": True,
+                "results": {name: count_items(items) for name, items in datasets.items()},
+                "error": ""
+            }
             
         else:
             return {
                 "success": False,
-                "error": f"Invalid mode '{mode}'. Use 'count' or 'stats'."
+                "error": f"Invalid mode '{mode}'. Use 'count', 'stats', or 'multi'."
             }
         
     except Exception as e:
@@ -150,7 +180,15 @@ def read_request() -> dict | None:
     except json.JSONDecodeError:
         # Clear invalid request
         request_path.write_text("")
-        return {"_parse_error": "Invalid JSON in request file"}
+        error = {"_parse_error": "Invalid JSON in request file"}
+        # Keep the id if one can be found, so the client sees the error without timing out
+        match = _ID_RE.search(content)
+        if match:
+            try:
+                error["id"] = json.loads(match.group(1))
+            except json.JSONDecodeError:
+                pass
+        return error
     except Exception:
         return None
 
@@ -168,7 +206,7 @@ def main():
     print("=" * 50)
     print(f"Monitoring: {REQUEST_FILE}")
     print(f"Responses:  {RESPONSE_FILE}")
-    print(f"Modes:      count, stats")
+    print(f"Modes:      count, stats, multi")
     print("=" * 50)
     print("Waiting for requests... (Ctrl+C to stop)")
     print()
@@ -187,9 +225,14 @@ def main():
                         "success": False,
                         "error": request["_parse_error"]
                     }
+                    if "id" in request:
+                        response["id"] = request["id"]
                 else:
                     print(f"Received request: {request}")
                     response = process_request(request)
+                    if "id" in request:
+                        # Echo the id so the client can match this response to its request
+                        response["id"] = request["id"]
                     print(f"Sending response: {response}")
                     print()
                 
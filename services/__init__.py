@@ -0,0 +1,49 @@
+"""
+In-process Services
+Author: Elizabeth Peyton
+
+Exposes the BookBase microservices as plain Python functions so the app can
+call them directly instead of round-tripping through request/response text
+files. Each function returns the same response shape as the file-based
+service it replaces.
+"""
+
+import random
+import re
+from collections import Counter
+
+import data_counter
+import text_formatter
+
+WORD_RE = re.compile(r"[A-Za-z']+")
+STOP_WORDS = frozenset({"the", "a", "an", "of", "and", "to", "in", "is"})
+
+
+def count_items(items: list) -> dict:
+    """Count total, unique, and per-item frequencies (Data Counter "count" mode)."""
+    return data_counter.process_request({"mode": "count", "data": items})
+
+
+def count_many(datasets: dict) -> dict:
+    """Count several named lists in one call (Data Counter "multi" mode)."""
+    return data_counter.process_request({"mode": "multi", "datasets": datasets})
+
+
+def format_text(text: str, mode: str) -> dict:
+    """Format text as upper, lower, title, or clean (Text Formatter)."""
+    response = text_formatter.process_request({"text": text, "format": mode})
+    # Only the shared read-only error response needs copying; the rest are fresh dicts
+    return response if isinstance(response, dict) else dict(response)
+
+
+def rng_select(items: list) -> dict:
+    """Pick one item at random (RNG service "selection" type)."""
+    if not items:
+        return {"status": "error", "message": "No items to select from"}
+    return {"status": "ok", "value": random.choice(items)}
+
+
+def common_words(text: str, limit: int = 10, stop_words: frozenset = STOP_WORDS) -> str:
+    """Return the most common words as CSV lines of word,count (Words service)."""
+    words = [w for w in WORD_RE.findall(text.lower()) if w not in stop_words]
+    return "\n".join(f"{word},{count}" for word, count in Counter(words).most_common(limit))
@@ -0,0 +1,87 @@
+"""
+Concurrency tests for the Text Formatter's file-based IPC.
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Each client process sends its requests from several threads at once,
+# the way several Streamlit sessions share one server process
+CLIENT_SCRIPT = """
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import bookbase
+
+client, threads, calls = map(int, sys.argv[1:])
+texts = [f"client {client} thread {t} call {c}" for t in range(threads) for c in range(calls)]
+with ThreadPoolExecutor(max_workers=threads) as pool:
+    responses = list(pool.map(lambda text: bookbase.call_text_formatter(text, "upper"), texts))
+print(json.dumps([[text, response] for text, response in zip(texts, responses)]))
+"""
+
+
+class ConcurrentClientTest(unittest.TestCase):
+    """Many clients batching requests through one service must each get their own response."""
+
+    CLIENTS = 12
+    THREADS = 3
+    CALLS = 10
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.service = subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / "text_formatter.py")],
+            cwd=self.workdir.name,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        # Wait for the service to create its files
+        request_file = Path(self.workdir.name, "text_formatter_request.txt")
+        deadline = time.monotonic() + 10
+        while not request_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def tearDown(self):
+        self.service.terminate()
+        self.service.wait()
+        self.workdir.cleanup()
+
+    def test_no_response_is_lost(self):
+        env = {**os.environ, "BOOKBASE_IPC": "files", "PYTHONPATH": str(REPO_ROOT)}
+        clients = [
+            subprocess.Popen(
+                [sys.executable, "-c", CLIENT_SCRIPT, str(client), str(self.THREADS), str(self.CALLS)],
+                cwd=self.workdir.name,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            for client in range(self.CLIENTS)
+        ]
+
+        results = []
+        for client in clients:
+            stdout, _ = client.communicate(timeout=120)
+            self.assertEqual(client.returncode, 0)
+            results.extend(json.loads(stdout))
+
+        self.assertEqual(len(results), self.CLIENTS * self.THREADS * self.CALLS)
+        for text, response in results:
+            self.assertTrue(response.get("success"), f"{text!r} got {response}")
+            self.assertEqual(response["result"], text.upper())
+
+
+if __name__ == "__main__":
+    unittest.main()